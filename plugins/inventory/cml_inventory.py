@@ -172,11 +172,18 @@ class InventoryModule(BaseInventoryPlugin):
         group_dict = {}
 
         lab = labs[0]
-        lab.sync()
+        # Fetch states once and walk the nodes without lazy re-syncs;
+        # addresses are only reported for BOOTED nodes
+        lab.sync_states()
+        lab.auto_sync = False
+        if any(node.state == 'BOOTED' for node in lab.nodes()):
+            lab.sync_layer3_addresses()
+        group_tags = set(self.group_tags or [])
         for node in lab.nodes():
             self.inventory.add_host(node.label, group=self.group)
+            node_state = node.state
             cml = {
-                'state': node.state,
+                'state': node_state,
                 'image_definition': node.image_definition,
                 'node_definition': node.node_definition,
                 'cpus': node.cpus,
@@ -187,46 +194,34 @@ class InventoryModule(BaseInventoryPlugin):
             interface_list = []
             ansible_host = None
             ansible_port = None
-            # pat_regex_list = [r"^pat:tcp:(\d+):22", r"^pat:(\d+):22"]
-            for tag in node.tags():
+            node_tags = node.tags()
+            for tag in node_tags:
                 fact_match = re.search(r"^ansible:([^=]+)=(\d+)$", tag)
-                pat_match = re.search(r"^pat:(?:tcp|udp)?:?(\d+):(\d+)", tag)
                 if fact_match:
                     self.display.vvv("Add fact to node {0}: {1}={2}".format(node.label, fact_match.group(1), fact_match.group(2)))
                     self.inventory.set_variable(node.label, fact_match.group(1), fact_match.group(2))
-                # for regex_pattern in pat_regex_list:
-                #     # Use re.search to find a match
-                elif pat_match:
+                    continue
+                pat_match = re.search(r"^pat:(?:tcp|udp)?:?(\d+):(\d+)", tag)
+                if pat_match:
                     self.display.vvv("Found PAT: outside_port={0}, inside_port={1}".format(pat_match.group(1), pat_match.group(2)))
-                    # Extract values from capture groups
-                    # outside_port = match.group(1)
+                    # Reach the node through the CML server's port translation
                     ansible_host = self.host
-                    # ansible_port = match.group(1)
-                    # break  # Exit the inner loop once a match is found
-                else:
-                    continue  # Continue with the next string if no match was found
             for interface in node.interfaces():
-                if node.state == 'BOOTED':
-                    # Fill out the oper data if the node is not fully booted
-                    interface_dict = {
-                        'name': interface.label,
-                        'state': interface.state,
-                        'ipv4_addresses': interface.discovered_ipv4,
-                        'ipv6_addresses': interface.discovered_ipv6,
-                        'mac_address': interface.discovered_mac_address
-                    }
+                # Discovered addresses are only filled in once BOOTED
+                interface_dict = {
+                    'name': interface.label,
+                    'state': interface.state,
+                    'ipv4_addresses': [],
+                    'ipv6_addresses': [],
+                    'mac_address': None
+                }
+                if node_state == 'BOOTED':
+                    interface_dict.update(ipv4_addresses=interface.discovered_ipv4,
+                                          ipv6_addresses=interface.discovered_ipv6,
+                                          mac_address=interface.discovered_mac_address)
                     # See if we can use this for ansible_host
                     if interface.discovered_ipv4 and not ansible_host:
                         ansible_host = interface.discovered_ipv4[0]
-                else:
-                    # Otherwise, set oper data to empty
-                    interface_dict = {
-                        'name': interface.label,
-                        'state': interface.state,
-                        'ipv4_addresses': [],
-                        'ipv6_addresses': [],
-                        'mac_address': None
-                    }
                 interface_list.append(interface_dict)
             cml.update({'interfaces': interface_list})
             if ansible_host:
@@ -235,7 +230,7 @@ class InventoryModule(BaseInventoryPlugin):
                 self.inventory.set_variable(node.label, 'ansible_port', ansible_port)
             self.inventory.set_variable(node.label, 'cml_facts', cml)
             self.display.vvv("Adding {0}({1}) to group {2}, state: {3}, ansible_host: {4}".format(
-                node.label, node.node_definition, self.group, node.state, ansible_host))
+                node.label, node.node_definition, self.group, node_state, ansible_host))
             # Group by node_definition
             if node.node_definition not in group_dict:
                 try:
@@ -244,8 +239,8 @@ class InventoryModule(BaseInventoryPlugin):
                     raise AnsibleParserError("Unable to add group %s: %s" % (group, to_text(e)))
             self.inventory.add_host(node.label, group=node.node_definition)
             # Find the group to create and add this host to
-            if self.group_tags:
-                for group in list(set(self.group_tags) & set(node.tags())):
+            if group_tags:
+                for group in group_tags.intersection(node_tags):
                     if group not in group_dict:
                         try:
                             group_dict[group] = self.inventory.add_group(group)
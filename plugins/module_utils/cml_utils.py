@@ -55,10 +55,12 @@ class cmlModule(object):
     def login(self):
         self.client = ClientLibrary('https://{0}'.format(self.host), self.user, self.password, ssl_verify=False)
 
-    def get_lab_by_name(self, name):
-        for lab in self.client.all_labs():
-            if lab.name == name:
-                return lab
+    def get_lab_by_title(self, title):
+        # Just take the first lab until we figure out how we want
+        # to handle duplicates
+        labs = self.client.find_labs_by_title(title)
+        if labs:
+            return labs[0]
         return None
 
     def get_node_by_name(self, lab, name):
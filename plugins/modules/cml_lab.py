@@ -42,11 +42,11 @@ options:
         required: true
         type: str
     file:
-        description: The name of the topology file to use.
+        description: The name of the topology file to use. Mutually exclusive with I(topology).
         required: false
         type: str
     topology:
-        description: The lab topology.
+        description: The lab topology. Mutually exclusive with I(file).
         required: false
         type: str
     state:
@@ -125,67 +125,82 @@ def run_module():
     # supports check mode
     module = AnsibleModule(
         argument_spec=argument_spec,
+        mutually_exclusive=[('file', 'topology')],
         supports_check_mode=True,
     )
     cml = cmlModule(module)
     cml.result['changed'] = False
-    labs = cml.client.find_labs_by_title(cml.params['lab'])
-    if len(labs) > 0:
-        lab = labs[0]
-    else:
-        lab = None
-
-    if cml.params['state'] == 'present':
+    title = cml.params['lab']
+    state = cml.params['state']
+    topology = cml.params['topology']
+    lab_file = cml.params['file']
+    wait = cml.params['wait']
+    lab = cml.get_lab_by_title(title)
+
+    if state == 'present':
         if lab is None:
-            if cml.params['topology']:
-                lab = cml.client.import_lab(cml.params['topology'], title=cml.params['lab'])
-            elif cml.params['file']:
-                if os.path.isabs(cml.params['file']):
-                    topology_file = cml.params['file']
+            if module.check_mode:
+                cml.exit_json(changed=True)
+            if topology:
+                lab = cml.client.import_lab(topology, title=title)
+            elif lab_file:
+                if os.path.isabs(lab_file):
+                    topology_file = lab_file
                 else:
-                    topology_file = os.getcwd() + '/' + cml.params['file']
-                lab = cml.client.import_lab_from_path(topology_file, title=cml.params['lab'])
+                    topology_file = os.getcwd() + '/' + lab_file
+                lab = cml.client.import_lab_from_path(topology_file, title=title)
             else:
-                lab = cml.client.create_lab(title=cml.params['lab'])
-            lab.title = cml.params['lab']
+                lab = cml.client.create_lab(title=title)
+            lab.title = title
             cml.result['changed'] = True
-    elif cml.params['state'] == 'started':
+    elif state == 'started':
         if lab is None:
-            if cml.params['topology']:
-                lab = cml.client.import_lab(cml.params['topology'], title=cml.params['lab'])
-                lab.start(wait=cml.params['wait'])
-            elif cml.params['file']:
-                lab = cml.client.import_lab_from_path(cml.params['file'], title=cml.params['lab'])
-                lab.start(wait=cml.params['wait'])
+            if module.check_mode:
+                cml.exit_json(changed=True)
+            if topology:
+                lab = cml.client.import_lab(topology, title=title)
+                lab.start(wait=wait)
+            elif lab_file:
+                lab = cml.client.import_lab_from_path(lab_file, title=title)
+                lab.start(wait=wait)
             else:
-                lab = cml.client.create_lab(title=cml.params['lab'])
-                lab.start(wait=cml.params['wait'])
-            lab.title = cml.params['lab']
+                lab = cml.client.create_lab(title=title)
+                lab.start(wait=wait)
+            lab.title = title
             cml.result['changed'] = True
         elif lab.state() == "STOPPED":
-            lab.start(wait=cml.params['wait'])
+            if module.check_mode:
+                cml.exit_json(changed=True)
+            lab.start(wait=wait)
             cml.result['changed'] = True
-    elif cml.params['state'] == 'absent':
-        if lab:
+    elif state == 'absent':
+        if lab is not None:
+            if module.check_mode:
+                cml.exit_json(changed=True)
             cml.result['changed'] = True
-            if lab.state() == "STARTED":
+            lab_state = lab.state()
+            if lab_state == "STARTED":
                 lab.stop(wait=True)
                 lab.wipe(wait=True)
-            elif lab.state() == "STOPPED":
+            elif lab_state == "STOPPED":
                 lab.wipe(wait=True)
             lab.remove()
-    elif cml.params['state'] == 'stopped':
-        if lab:
+    elif state == 'stopped':
+        if lab is not None:
             if lab.state() == "STARTED":
+                if module.check_mode:
+                    cml.exit_json(changed=True)
                 cml.result['changed'] = True
                 lab.stop(wait=True)
-    elif cml.params['state'] == 'wiped':
-        if lab:
+    elif state == 'wiped':
+        if lab is not None:
             if lab.state() == "STOPPED":
+                if module.check_mode:
+                    cml.exit_json(changed=True)
                 cml.result['changed'] = True
                 lab.wipe(wait=True)
 
-    cml.exit_json(**cml.result)
+    cml.exit_json()
 
 
 def main():
@@ -80,17 +80,21 @@ def run_module():
     )
     cml = cmlModule(module)
     cml_facts = {}
-    labs = cml.client.find_labs_by_title(cml.params['lab'])
-    if len(labs):
-        # Just take the first lab until we figure out how we want
-        # to handle duplicates
-        lab = labs[0]
-        lab.sync()
+    lab = cml.get_lab_by_title(cml.params['lab'])
+    if lab is not None:
+        # Prefetch what the node walk below reads, then stop auto-syncing
+        lab.sync_states()
+        lab.auto_sync = False
+        if lab.interfaces():
+            lab.sync_statistics()
+        if any(node.state == 'BOOTED' for node in lab.nodes()):
+            lab.sync_layer3_addresses()
         cml_facts['details'] = lab.details()
         cml_facts['nodes'] = {}
         for node in lab.nodes():
+            node_state = node.state
             cml_facts['nodes'][node.label] = {
-                'state': node.state,
+                'state': node_state,
                 'image_definition': node.image_definition,
                 'node_definition': node.node_definition,
                 'cpus': node.cpus,
@@ -103,41 +107,30 @@ def run_module():
             ansible_host = None
             ansible_host_interface = None
             for interface in node.interfaces():
-                if node.state == 'BOOTED':
-                    # Fill out the oper data if the node is not fully booted
-                    interface_data = {
-                        'state': interface.state,
-                        'ipv4_addresses': interface.discovered_ipv4,
-                        'ipv6_addresses': interface.discovered_ipv6,
-                        'mac_address': interface.discovered_mac_address,
-                        'is_physical': interface.is_physical,
-                        'readbytes': interface.readbytes,
-                        'readpackets': interface.readpackets,
-                        'writebytes': interface.writebytes,
-                        'writepackets': interface.writepackets
-                    }
+                # Counters are always reported, addresses only once BOOTED
+                interface_data = {
+                    'state': interface.state,
+                    'ipv4_addresses': [],
+                    'ipv6_addresses': [],
+                    'mac_address': None,
+                    'is_physical': interface.is_physical,
+                    'readbytes': interface.readbytes,
+                    'readpackets': interface.readpackets,
+                    'writebytes': interface.writebytes,
+                    'writepackets': interface.writepackets
+                }
+                if node_state == 'BOOTED':
+                    interface_data.update(ipv4_addresses=interface.discovered_ipv4,
+                                          ipv6_addresses=interface.discovered_ipv6,
+                                          mac_address=interface.discovered_mac_address)
                     # See if we can use this for ansible_host
                     if interface.discovered_ipv4 and not ansible_host:
                         ansible_host = interface.discovered_ipv4[0]
                         ansible_host_interface = interface.label
-                else:
-                    # Otherwise, set oper data to empty
-                    interface_data = {
-                        'state': interface.state,
-                        'ipv4_addresses': [],
-                        'ipv6_addresses': [],
-                        'mac_address': None,
-                        'is_physical': interface.is_physical,
-                        'readbytes': interface.readbytes,
-                        'readpackets': interface.readpackets,
-                        'writebytes': interface.writebytes,
-                        'writepackets': interface.writepackets
-                    }
                 cml_facts['nodes'][node.label]['interfaces'][interface.label] = interface_data
             cml_facts['nodes'][node.label]['ansible_host'] = ansible_host
             cml_facts['nodes'][node.label]['ansible_host_interface'] = ansible_host_interface
-    cml.result['cml_facts'] = cml_facts
-    cml.exit_json(**cml.result)
+    cml.exit_json(cml_facts=cml_facts)
 
 
 def main():
@@ -51,38 +51,31 @@ options:
         description: The name of the node
         required: true
         type: str
-
     node_definition:
         description: The node definition of this node
         required: false
         type: str
-
     image_definition:
         description: The image definition of this node
         required: false
         type: str
-
     config:
         description: The day0 configuration of this node
         required: false
         type: str
-
     x:
         description: X coordinate on topology canvas
         required: false
         type: int
-
     y:
         description: Y coordinate on topology canvas
         required: false
         type: int
-
     tags:
         description: List of tags
         required: false
         type: list
         elements: str
-
     wait:
         description: Wait for lab virtual machines to boot before continuing
         required: false
@@ -144,44 +137,57 @@ def run_module():
     )
     cml = cmlModule(module)
 
-    labs = cml.client.find_labs_by_title(cml.params['lab'])
-    if len(labs) > 0:
-        lab = labs[0]
-    else:
-        cml.fail_json("Cannot find lab {0}".format(cml.params['lab']))
-
-    node = cml.get_node_by_name(lab, cml.params['name'])
-    if cml.params['state'] == 'present':
+    title = cml.params['lab']
+    state = cml.params['state']
+    name = cml.params['name']
+    config = cml.params['config']
+    image_definition = cml.params['image_definition']
+    wait = cml.params['wait']
+    lab = cml.get_lab_by_title(title)
+    if lab is None:
+        cml.fail_json("Cannot find lab {0}".format(title))
+
+    node = cml.get_node_by_name(lab, name)
+    if state == 'present':
         if node is None:
-            node = lab.create_node(label=cml.params['name'], node_definition=cml.params['node_definition'])
+            if module.check_mode:
+                cml.exit_json(changed=True)
+            node = lab.create_node(label=name, node_definition=cml.params['node_definition'])
             cml.result['changed'] = True
-    elif cml.params['state'] == 'started':
+    elif state == 'started':
         if node is None:
             cml.fail_json("Node must be created before it is started")
-        if node.state not in ['STARTED', 'BOOTED']:
-            if node.state == 'DEFINED_ON_CORE' and cml.params['config']:
-                node.config = cml.params['config']
-            if cml.params['image_definition']:
-                node.image_definition = cml.params['image_definition']
-            if cml.params['wait'] is False:
+        node_state = node.state
+        if node_state not in ['STARTED', 'BOOTED']:
+            if module.check_mode:
+                cml.exit_json(changed=True)
+            if node_state == 'DEFINED_ON_CORE' and config:
+                node.config = config
+            if image_definition:
+                node.image_definition = image_definition
+            if wait is False:
                 lab.wait_for_covergence = False
             node.start()
             cml.result['changed'] = True
-    elif cml.params['state'] == 'stopped':
+    elif state == 'stopped':
         if node is None:
             cml.fail_json("Node must be created before it is stopped")
         if node.state not in ['STOPPED', 'DEFINED_ON_CORE']:
-            if cml.params['wait'] is False:
+            if module.check_mode:
+                cml.exit_json(changed=True)
+            if wait is False:
                 lab.wait_for_covergence = False
             node.stop()
             cml.result['changed'] = True
-    elif cml.params['state'] == 'wiped':
+    elif state == 'wiped':
         if node is None:
             cml.fail_json("Node must be created before it is wiped")
         if node.state not in ['DEFINED_ON_CORE']:
-            node.wipe(wait=cml.params['wait'])
+            if module.check_mode:
+                cml.exit_json(changed=True)
+            node.wipe(wait=wait)
             cml.result['changed'] = True
-    cml.exit_json(**cml.result)
+    cml.exit_json()
 
 
 def main():
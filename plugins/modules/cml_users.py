@@ -146,20 +146,19 @@ def run_module():
         argument_spec=argument_spec,
         supports_check_mode=True,
     )
+    if not HAS_REQUESTS:
+        module.fail_json(msg=missing_required_lib('requests'), exception=REQUESTS_IMPORT_ERROR)
+
     cml = cmlModule(module)
     cml.result['changed'] = False
     cml.result['name'] = cml.params['name']
     cml.result['state'] = cml.params['state']
     userid = get_userid(cml)
 
-    if not HAS_REQUESTS:
-        # Needs: from ansible.module_utils.basic import missing_required_lib
-        module.fail_json(msg=missing_required_lib('requests'), exception=REQUESTS_IMPORT_ERROR)
-
     if cml.params['state'] == 'present':
         if userid is None:
             if module.check_mode:
-                module.exit_json(changed=True)
+                cml.exit_json(changed=True)
             module.debug('Create user %s' % cml.params['name'])
             try:
                 cml.client.user_management.create_user(
@@ -176,14 +175,14 @@ def run_module():
     elif cml.params['state'] == 'absent':
         if userid is not None:
             if module.check_mode:
-                module.exit_json(changed=True)
+                cml.exit_json(changed=True)
             try:
                 cml.client.user_management.delete_user(userid)
                 cml.result['changed'] = True
             except requests.exceptions.RequestException as e:
                 cml.fail_json(name=cml.params['name'], msg=e, rc=-1)
 
-    cml.exit_json(**cml.result)
+    cml.exit_json()
 
 
 def main():